@@ -368,6 +368,8 @@ def iofq(S, q):
     pi = numpy.pi
 
     # The brute-force calculation is very slow. Thus we optimize a little bit.
+    # All pair distances are computed at once with numpy and the pairs with
+    # the same elements, distance and DW factor are grouped together.
 
     # The precision of distance measurements
     deltad = 1e-6
@@ -375,65 +377,50 @@ def iofq(S, q):
     deltau = deltad**2
     umult = int(1/deltau)
 
-    pairdict = {}
-    elcount = {}
-    n = len(S)
-    for i in range(n):
-
-        # count the number of each element
-        eli = S[i].element
-        m = elcount.get(eli, 0)
-        elcount[eli] = m + 1
-
-        for j in range(i + 1, n):
-
-            elj = S[j].element
-
-            # Get the pair
-            els = [eli, elj]
-            els.sort()
-
-            # Get the distance to the desired precision
-            d = S.distance(i, j)
-            D = int(d*dmult)
-
-            # Get the DW factor to the same precision
-            ss = S[i].Uisoequiv + S[j].Uisoequiv
-            SS = int(ss*umult)
-
-            # Record the multiplicity of this pair
-            key = (els[0], els[1], D, SS)
-            mult = pairdict.get(key, 0)
-            pairdict[key] = mult + 1
-
-    # Now we can calculate IofQ from the pair dictionary. Making the dictionary
-    # first reduces the amount of calls to sinc and exp we have to make.
-
-    # First we must cache the scattering factors
-    fdict = {}
-    for el in elcount:
-        fdict[el] = getXScatteringFactor(el, q)
-
-    # Now we can compute I(Q) for the i != j pairs
-    y = 0
+    # Index the elements and cache their scattering factors
+    elements = [a.element for a in S]
+    ellist = sorted(set(elements))
+    elidx = numpy.array([ellist.index(el) for el in elements], dtype=int)
+    f = numpy.array([getXScatteringFactor(el, q) * numpy.ones_like(q)
+                     for el in ellist])
+    f = f.reshape(len(ellist), len(q))
+
+    # Get all j > i pairs, their distances to the desired precision and the
+    # DW factors to the same precision.
+    i, j = numpy.triu_indices(len(S), 1)
+    xyz = numpy.reshape(S.xyz_cartn, (-1, 3))
+    d = numpy.sqrt(numpy.sum((xyz[i] - xyz[j])**2, axis=1))
+    uiso = numpy.array([a.Uisoequiv for a in S], dtype=float)
+    ss = uiso[i] + uiso[j]
+    keys = numpy.array([numpy.minimum(elidx[i], elidx[j]),
+                        numpy.maximum(elidx[i], elidx[j]),
+                        (d * dmult).astype(numpy.int64),
+                        (ss * umult).astype(numpy.int64)]).T
+
+    # Record the multiplicity of each pair. Grouping the pairs reduces the
+    # amount of sinc and exp we have to compute.
+    keys, mult = numpy.unique(keys, axis=0, return_counts=True)
+    eli, elj, D, SS = keys.T
+
+    # Now we can compute I(Q) for the i != j pairs. This is done for blocks
+    # of pairs to limit the size of the temporary (pairs, q) arrays.
+    # Note that numpy's sinc(x) = sin(x*pi)/(x*pi)
     x = q * deltad / pi
-    for key, mult in pairdict.items():
-        eli = key[0]
-        elj = key[1]
-        fi = fdict[eli]
-        fj = fdict[elj]
-        D = key[2]
-        SS = key[3]
-
-        # Note that numpy's sinc(x) = sin(x*pi)/(x*pi)
-        y += fi * fj * mult * sinc(x * D) * exp(-0.5 * SS * deltau * q**2)
+    y = numpy.zeros(len(q))
+    blocksize = 2000
+    for lo in range(0, len(mult), blocksize):
+        hi = lo + blocksize
+        yb = f[eli[lo:hi]] * f[elj[lo:hi]] * mult[lo:hi, numpy.newaxis]
+        yb *= sinc(numpy.outer(D[lo:hi], x))
+        yb *= exp(-0.5 * deltau * numpy.outer(SS[lo:hi], q**2))
+        y += yb.sum(axis=0)
 
     # We must multiply by 2 since we only counted j > i pairs.
     y *= 2
 
     # Now we must add in the i == j pairs.
-    for el, f in fdict.items():
-        y += f**2 * elcount[el]
+    elcount = numpy.bincount(elidx, minlength=len(ellist))
+    y += numpy.dot(elcount, f**2)
 
     # And that's it!
 
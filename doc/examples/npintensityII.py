@@ -35,6 +35,7 @@ Extensions
 """
 
 import numpy
+from numpy.polynomial.polynomial import polyval
 
 from diffpy.srfit.fitbase import FitContribution, FitRecipe, Profile, FitResults
 from npintensity import IntensityGenerator
@@ -96,17 +97,32 @@ def makeRecipe(strufile, datname1, datname2):
     # in different contributions are different Parameters even if they have the
     # same names.  FitContributions are isolated namespaces than only share
     # information if you tell them to by using addParameter or addParameterSet.
-    bkgdstr = "b0 + b1*q + b2*q**2 + b3*q**3 + b4*q**4 + b5*q**5 + b6*q**6 +\
-               b7*q**7 +b8*q**8 + b9*q**9"
+    #
+    # The background is a polynomial of 9th order. We register it as a python
+    # function that evaluates the polynomial with numpy in a single call,
+    # rather than as a string equation, where each q**k term would be
+    # computed as a separate array.
+    def bkgd(q, b0, b1, b2, b3, b4, b5, b6, b7, b8, b9):
+        return polyval(q, (b0, b1, b2, b3, b4, b5, b6, b7, b8, b9))
 
-    contribution1.registerStringFunction(bkgdstr, "bkgd")
-    contribution2.registerStringFunction(bkgdstr, "bkgd")
+    contribution1.registerFunction(bkgd)
+    contribution2.registerFunction(bkgd)
 
     # We will create the broadening function by registering a python function.
-    pi = numpy.pi
-    exp = numpy.exp
+    # The function is evaluated many times during the refinement, therefore
+    # we compute it in a single array using in-place numpy operations, which
+    # avoids allocation of temporary arrays for each intermediate result.
+    # The constant part of the normalization is computed only once here.
+    invsqrt2pi = 1 / numpy.sqrt(2 * numpy.pi)
     def gaussian(q, q0, width):
-        return 1/(2*pi*width**2)**0.5 * exp(-0.5 * ((q-q0)/width)**2)
+        invwidth = 1.0 / width
+        g = q - q0
+        g *= invwidth
+        g *= g
+        g *= -0.5
+        numpy.exp(g, out=g)
+        g *= invsqrt2pi * invwidth
+        return g
 
     contribution1.registerFunction(gaussian)
     contribution2.registerFunction(gaussian)
@@ -115,9 +131,11 @@ def makeRecipe(strufile, datname1, datname2):
     contribution2.q0.value = x[len(x) // 2]
 
     # Now we can incorporate the scale and bkgd into our calculation. We also
-    # convolve the signal with the gaussian to broaden it.
-    contribution1.setEquation("scale * convolve(I, gaussian) + bkgd")
-    contribution2.setEquation("scale * convolve(I, gaussian) + bkgd")
+    # convolve the signal with the gaussian to broaden it. The "fftconvolve"
+    # operator gives the same result as "convolve", but it uses the fast
+    # Fourier transform, which scales better for long signals.
+    contribution1.setEquation("scale * fftconvolve(I, gaussian) + bkgd")
+    contribution2.setEquation("scale * fftconvolve(I, gaussian) + bkgd")
 
     # Make a FitRecipe and associate the FitContributions.
     recipe = FitRecipe()
@@ -128,26 +146,11 @@ def makeRecipe(strufile, datname1, datname2):
     # background that we just defined in the FitContributions. We have to do
     # this separately for each FitContribution. We tag the variables so it is
     # easy to retrieve the background variables.
-    recipe.addVar(contribution1.b0, 0, name = "b1_0", tag = "bcoeffs1")
-    recipe.addVar(contribution1.b1, 0, name = "b1_1", tag = "bcoeffs1")
-    recipe.addVar(contribution1.b2, 0, name = "b1_2", tag = "bcoeffs1")
-    recipe.addVar(contribution1.b3, 0, name = "b1_3", tag = "bcoeffs1")
-    recipe.addVar(contribution1.b4, 0, name = "b1_4", tag = "bcoeffs1")
-    recipe.addVar(contribution1.b5, 0, name = "b1_5", tag = "bcoeffs1")
-    recipe.addVar(contribution1.b6, 0, name = "b1_6", tag = "bcoeffs1")
-    recipe.addVar(contribution1.b7, 0, name = "b1_7", tag = "bcoeffs1")
-    recipe.addVar(contribution1.b8, 0, name = "b1_8", tag = "bcoeffs1")
-    recipe.addVar(contribution1.b9, 0, name = "b1_9", tag = "bcoeffs1")
-    recipe.addVar(contribution2.b0, 0, name = "b2_0", tag = "bcoeffs2")
-    recipe.addVar(contribution2.b1, 0, name = "b2_1", tag = "bcoeffs2")
-    recipe.addVar(contribution2.b2, 0, name = "b2_2", tag = "bcoeffs2")
-    recipe.addVar(contribution2.b3, 0, name = "b2_3", tag = "bcoeffs2")
-    recipe.addVar(contribution2.b4, 0, name = "b2_4", tag = "bcoeffs2")
-    recipe.addVar(contribution2.b5, 0, name = "b2_5", tag = "bcoeffs2")
-    recipe.addVar(contribution2.b6, 0, name = "b2_6", tag = "bcoeffs2")
-    recipe.addVar(contribution2.b7, 0, name = "b2_7", tag = "bcoeffs2")
-    recipe.addVar(contribution2.b8, 0, name = "b2_8", tag = "bcoeffs2")
-    recipe.addVar(contribution2.b9, 0, name = "b2_9", tag = "bcoeffs2")
+    for i, contribution in enumerate([contribution1, contribution2], 1):
+        for k in range(10):
+            bk = getattr(contribution, "b%i" % k)
+            recipe.addVar(bk, 0, name = "b%i_%i" % (i, k),
+                    tag = "bcoeffs%i" % i)
 
     # We also want to adjust the scale and the convolution width
     recipe.addVar(contribution1.scale, 1, name = "scale1")
@@ -190,10 +193,12 @@ def plotResults(recipe):
     Icalc2 = recipe.bucky2.profile.ycalc
     bkgd2 = recipe.bucky2.evaluateEquation("bkgd")
     diff2 = I2 - Icalc2
-    offset = 1.2 * max(I2) * numpy.ones_like(I2)
-    I1 += offset
-    Icalc1 += offset
-    bkgd1 += offset
+    # Shift the first data set above the second one. Do not add in place to
+    # the arrays owned by the recipe.
+    offset = 1.2 * I2.max()
+    I1 = I1 + offset
+    Icalc1 = Icalc1 + offset
+    bkgd1 = bkgd1 + offset
     diff1 += offset
 
     import pylab
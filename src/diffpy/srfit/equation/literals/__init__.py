@@ -29,6 +29,7 @@ __all__ = ["Argument", "Operator", "BinaryOperator", "CustomOperator",
            "AdditionOperator", "SubtractionOperator",
            "MultiplicationOperator", "DivisionOperator", "ExponentiationOperator",
            "RemainderOperator", "NegationOperator", "ConvolutionOperator",
+           "FFTConvolutionOperator",
            "SumOperator", "UFuncOperator", "ArrayOperator", "PolyvalOperator",
            "makeOperator"]
 
@@ -47,6 +48,7 @@ from diffpy.srfit.equation.literals.operators import ExponentiationOperator
 from diffpy.srfit.equation.literals.operators import RemainderOperator
 from diffpy.srfit.equation.literals.operators import NegationOperator
 from diffpy.srfit.equation.literals.operators import ConvolutionOperator
+from diffpy.srfit.equation.literals.operators import FFTConvolutionOperator
 from diffpy.srfit.equation.literals.operators import UFuncOperator
 from diffpy.srfit.equation.literals.operators import SumOperator
 from diffpy.srfit.equation.literals.operators import ArrayOperator
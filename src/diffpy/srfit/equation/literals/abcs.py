@@ -27,6 +27,8 @@ import six
 class LiteralABC(object):
     """Abstract Base Class for Literal. See Literal for usage."""
 
+    __slots__ = ()
+
     @abstractmethod
     def identify(self, visitor): pass
 
@@ -41,6 +43,8 @@ class LiteralABC(object):
 class ArgumentABC(LiteralABC):
     """Abstract Base Class for Argument. See Argument for usage."""
 
+    __slots__ = ()
+
     @abstractmethod
     def setValue(self, value): pass
 
@@ -53,6 +57,8 @@ class ArgumentABC(LiteralABC):
 class OperatorABC(LiteralABC):
     """Abstract Base Class for Operator. See Operator for usage."""
 
+    __slots__ = ()
+
     @abstractmethod
     def addLiteral(self, literal): pass
 
@@ -37,7 +37,7 @@ class Argument(Literal, ArgumentABC):
 
     """
 
-    const = None
+    __slots__ = ('const',)
 
     def __init__(self, name = None, value = None, const = False):
         """Initialization."""
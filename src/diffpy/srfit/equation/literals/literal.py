@@ -36,13 +36,14 @@ class Literal(Observable,LiteralABC):
 
     """
 
-    name = None
-    _value = None
+    __slots__ = ('name', '_value')
 
     def __init__(self, name=None):
         """Initialization."""
         Observable.__init__(self)
-        if name is not None:
+        self._value = None
+        # keep the class-level name of derived classes, such as Operators
+        if name is not None or not hasattr(self, 'name'):
             self.name = name
         return
 
@@ -63,6 +64,18 @@ class Literal(Observable,LiteralABC):
         self.notify(other)
         return
 
+    def __setstate__(self, state):
+        """Restore the object from a pickled state.
+
+        Objects pickled by older versions may rely on the former class
+        defaults of name and _value, which are therefore set first.
+        """
+        self._value = None
+        if not hasattr(self, 'name'):
+            self.name = None
+        Observable.__setstate__(self, state)
+        return
+
     def __str__(self):
         return "%s(%s)"%(self.__class__.__name__, self.name)
 
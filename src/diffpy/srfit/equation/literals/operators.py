@@ -28,6 +28,7 @@ but they all identify themselves with the Visitor.onOperator method.
 __all__ = ["Operator", "AdditionOperator", "SubtractionOperator",
            "MultiplicationOperator", "DivisionOperator", "ExponentiationOperator",
            "RemainderOperator", "NegationOperator", "ConvolutionOperator",
+           "FFTConvolutionOperator",
            "SumOperator", "UFuncOperator", "ArrayOperator", "PolyvalOperator"]
 
 import numpy
@@ -275,13 +276,28 @@ class NegationOperator(UnaryOperator):
 def _conv(v1, v2):
     # Get the full convolution
     c = numpy.convolve(v1, v2, mode="full")
+    return _alignconv(v1, c)
+
+
+def _fftconv(v1, v2):
+    # Get the full convolution from the product of Fourier transforms.
+    # Zero-pad to a power of 2 for the best FFT performance.
+    n = len(v1) + len(v2) - 1
+    nfft = 1 << (n - 1).bit_length()
+    f1 = numpy.fft.rfft(v1, nfft)
+    f2 = numpy.fft.rfft(v2, nfft)
+    c = numpy.fft.irfft(f1 * f2, nfft)[:n]
+    return _alignconv(v1, c)
+
+
+def _alignconv(v1, c):
     # Find the centroid of the first signal
-    s1 = sum(v1)
+    s1 = numpy.sum(v1)
     x1 = numpy.arange(len(v1), dtype=float)
     c1idx = numpy.sum(v1 * x1)/s1
     # Find the centroid of the convolution
     xc = numpy.arange(len(c), dtype=float)
-    ccidx = numpy.sum(c * xc)/sum(c)
+    ccidx = numpy.sum(c * xc)/numpy.sum(c)
     # Interpolate the convolution such that the centroids line up. This
     # uses linear interpolation.
     shift = ccidx - c1idx
@@ -289,7 +305,7 @@ def _conv(v1, v2):
     c = numpy.interp(x1, xc, c)
 
     # Normalize
-    sc = sum(c)
+    sc = numpy.sum(c)
     if sc > 0:
         c *= s1/sc
 
@@ -314,6 +330,19 @@ class ConvolutionOperator(BinaryOperator):
     pass
 
 
+class FFTConvolutionOperator(BinaryOperator):
+    """Convolve two signals using the fast Fourier transform.
+
+    This gives the same result as the ConvolutionOperator, but the convolution
+    is evaluated in O(N log N) time.  This is faster for long signals.
+    """
+
+    name = "fftconvolve"
+    symbol = "fftconvolve"
+    operation = staticmethod(_fftconv)
+    pass
+
+
 class SumOperator(UnaryOperator):
     """numpy.sum operator."""
 
@@ -747,12 +747,28 @@ class FitRecipe(_fitrecipe_interface, RecipeOrganizer):
 
     def getValues(self):
         """Get the current values of the variables in a list."""
-        return array([v.value for v in self._parameters.values() if
-            self.isFree(v)])
+        return array([v.value for v in self._getFreeVars()])
+
+    def setValues(self, p):
+        """Set the values of the variables.
+
+        p   --  The list of new variable values, provided in the same order
+                as returned by getNames.
+
+        Raises ValueError if the length of p differs from the number of
+        variables.
+        """
+        freevars = self._getFreeVars()
+        if len(p) != len(freevars):
+            emsg = "Expected %i variable values, got %i."
+            raise ValueError(emsg % (len(freevars), len(p)))
+        for var, pval in zip(freevars, p):
+            var.setValue(pval)
+        return
 
     def getNames(self):
         """Get the names of the variables in a list."""
-        return [v.name for v in self._parameters.values() if self.isFree(v)]
+        return [v.name for v in self._getFreeVars()]
 
     def getBounds(self):
         """Get the bounds on variables in a list.
@@ -760,7 +776,7 @@ class FitRecipe(_fitrecipe_interface, RecipeOrganizer):
         Returns a list of (lb, ub) pairs, where lb is the lower bound and ub is
         the upper bound.
         """
-        return [v.bounds for v in self._parameters.values() if self.isFree(v)]
+        return [v.bounds for v in self._getFreeVars()]
 
     def getBounds2(self):
         """Get the bounds on variables in two lists.
@@ -792,11 +808,19 @@ class FitRecipe(_fitrecipe_interface, RecipeOrganizer):
     def _applyValues(self, p):
         """Apply variable values to the variables."""
         if len(p) == 0: return
-        vargen = (v for v in self._parameters.values() if self.isFree(v))
-        for var, pval in zip(vargen, p):
+        for var, pval in zip(self._getFreeVars(), p):
             var.setValue(pval)
         return
 
+    def _getFreeVars(self):
+        """Get a list of the variables that are not fixed.
+
+        This looks up the fixed variables only once, which is faster than
+        calling isFree for each variable.
+        """
+        fixed = self._tagmanager.union(self._fixedtag)
+        return [v for v in self._parameters.values() if v not in fixed]
+
     def _updateConfiguration(self):
         """Notify RecipeContainers in hierarchy of configuration change."""
         self._ready = False
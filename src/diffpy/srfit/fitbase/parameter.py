@@ -53,6 +53,8 @@ class Parameter(_parameter_interface, Argument, Validatable):
 
     """
 
+    __slots__ = ('constrained', 'bounds')
+
     def __init__(self, name, value = None, const = False):
         """Initialization.
 
@@ -165,6 +167,8 @@ class ParameterProxy(Parameter):
 
     """
 
+    __slots__ = ('par',)
+
 
     def __init__(self, name, par):
         """Initialization.
@@ -183,6 +187,18 @@ class ParameterProxy(Parameter):
 
     # define properties to use attributes of the proxied Parameter -----------
 
+    @property
+    def const(self):
+        """A flag indicating if the proxied Parameter is constant.
+        """
+        return self.par.const
+
+    @const.setter
+    def const(self, value):
+        self.par.const = bool(value)
+        return
+
+
     @property
     def constrained(self):
         """A flag indicating if the proxied Parameter is constrained.
@@ -265,6 +281,8 @@ class ParameterAdapter(Parameter):
 
     """
 
+    __slots__ = ('obj', 'getter', 'setter', 'attr')
+
     def __init__(self, name, obj, getter = None, setter = None, attr = None):
         """Wrap an object as a Parameter.
 
@@ -29,6 +29,8 @@ class Validatable(object):
 
     """
 
+    __slots__ = ()
+
     def _validateOthers(self, iterable):
         """Method to validate configuration of Validatables in iterable.
 
@@ -32,6 +32,8 @@ from diffpy.srfit.equation.literals.abcs import ArgumentABC
 class ParameterInterface(object):
     """Mix-in class for enhancing the Parameter interface."""
 
+    __slots__ = ()
+
     def __lshift__(self, v):
         """setValue with <<
 
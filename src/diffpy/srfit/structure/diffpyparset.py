@@ -30,6 +30,8 @@ DiffpyAtomParSet      --  Adapter for diffpy.structure.Atom
 
 __all__ = ["DiffpyStructureParSet"]
 
+import numpy
+
 from diffpy.srfit.fitbase.parameter import ParameterProxy
 from diffpy.srfit.fitbase.parameter import ParameterAdapter
 from diffpy.srfit.fitbase.parameterset import ParameterSet
@@ -56,6 +58,22 @@ class _xyzsetter(object):
         atom.xyz[self.i] = value
 
 
+# Accessors for B-factors, which are computed from the U-factor Parameters
+_BtoU = 1.0 / (8 * numpy.pi**2)
+_UtoB = 1.0 / _BtoU
+
+def _bgetter(upar):
+    return _UtoB * upar.getValue()
+
+def _bsetter(upar, value):
+    upar.setValue(_BtoU * value)
+
+
+# Row and column indices of the unique Uij elements in the adparray property.
+_ADPROWS = [0, 1, 2, 0, 0, 1]
+_ADPCOLS = [0, 1, 2, 1, 2, 2]
+
+
 class DiffpyAtomParSet(ParameterSet):
     """A wrapper for diffpy.structure.Atom.
 
@@ -79,8 +97,10 @@ class DiffpyAtomParSet(ParameterSet):
     B11, B22, B33, B12, B21, B23, B32, B13, B31
                 --  Anisotropic displacement factor for atom (ParameterAdapter
                     or ParameterProxy). Note that the Bij and Bji parameters
-                    are the same. (Bij = 8*pi**2*Uij)
-    Biso        --  Isotropic ADP (ParameterAdapter).
+                    are the same. (Bij = 8*pi**2*Uij)  The Bij parameters
+                    adapt the corresponding Uij parameters and change their
+                    value when set.
+    Biso        --  Isotropic ADP (ParameterAdapter of Uiso).
 
     """
 
@@ -104,9 +124,12 @@ class DiffpyAtomParSet(ParameterSet):
         self.addParameter(occupancy)
         self.addParameter(ParameterProxy("occ", occupancy))
         # U
-        self.addParameter(ParameterAdapter("U11", a, attr = "U11"))
-        self.addParameter(ParameterAdapter("U22", a, attr = "U22"))
-        self.addParameter(ParameterAdapter("U33", a, attr = "U33"))
+        U11 = ParameterAdapter("U11", a, attr = "U11")
+        U22 = ParameterAdapter("U22", a, attr = "U22")
+        U33 = ParameterAdapter("U33", a, attr = "U33")
+        self.addParameter(U11)
+        self.addParameter(U22)
+        self.addParameter(U33)
         U12 = ParameterAdapter("U12", a, attr = "U12")
         U21 = ParameterProxy("U21", U12)
         U13 = ParameterAdapter("U13", a, attr = "U13")
@@ -119,16 +142,17 @@ class DiffpyAtomParSet(ParameterSet):
         self.addParameter(U31)
         self.addParameter(U23)
         self.addParameter(U32)
-        self.addParameter(ParameterAdapter("Uiso", a, attr = "Uisoequiv"))
-        # B
-        self.addParameter(ParameterAdapter("B11", a, attr = "B11"))
-        self.addParameter(ParameterAdapter("B22", a, attr = "B22"))
-        self.addParameter(ParameterAdapter("B33", a, attr = "B33"))
-        B12 = ParameterAdapter("B12", a, attr = "B12")
+        Uiso = ParameterAdapter("Uiso", a, attr = "Uisoequiv")
+        self.addParameter(Uiso)
+        # B - these are scaled views of the U Parameters
+        self.addParameter(ParameterAdapter("B11", U11, _bgetter, _bsetter))
+        self.addParameter(ParameterAdapter("B22", U22, _bgetter, _bsetter))
+        self.addParameter(ParameterAdapter("B33", U33, _bgetter, _bsetter))
+        B12 = ParameterAdapter("B12", U12, _bgetter, _bsetter)
         B21 = ParameterProxy("B21", B12)
-        B13 = ParameterAdapter("B13", a, attr = "B13")
+        B13 = ParameterAdapter("B13", U13, _bgetter, _bsetter)
         B31 = ParameterProxy("B31", B13)
-        B23 = ParameterAdapter("B23", a, attr = "B23")
+        B23 = ParameterAdapter("B23", U23, _bgetter, _bsetter)
         B32 = ParameterProxy("B32", B23)
         self.addParameter(B12)
         self.addParameter(B21)
@@ -136,7 +160,7 @@ class DiffpyAtomParSet(ParameterSet):
         self.addParameter(B31)
         self.addParameter(B23)
         self.addParameter(B32)
-        self.addParameter(ParameterAdapter("Biso", a, attr = "Bisoequiv"))
+        self.addParameter(ParameterAdapter("Biso", Uiso, _bgetter, _bsetter))
         return
 
     def __repr__(self):
@@ -154,10 +178,23 @@ class DiffpyAtomParSet(ParameterSet):
 
 
 def _latgetter(par):
-    return bind2nd(getattr, par)
+    return bind2nd(_getlatpar, par)
 
 def _latsetter(par):
-    return bind2nd(setattr, par)
+    return bind2nd(_setlatpar, par)
+
+def _getlatpar(latps, par):
+    pending = getattr(latps, '_pending', None)
+    if pending and par in pending:
+        return pending[par]
+    return getattr(latps.lattice, par)
+
+def _setlatpar(latps, par, value):
+    if latps._defer:
+        latps._pending[par] = value
+    else:
+        setattr(latps.lattice, par, value)
+    return
 
 
 class DiffpyLatticeParSet(ParameterSet):
@@ -166,16 +203,28 @@ class DiffpyLatticeParSet(ParameterSet):
     This class derives from diffpy.srfit.fitbase.parameterset.ParameterSet. See
     this class for base attributes.
 
+    Every change of a lattice parameter makes the diffpy.structure.Lattice
+    recalculate its metric tensor and base vectors.  Use deferUpdates to
+    collect the changes and apply them at once in the flush method.
+
     Attributes
     lattice     --  The diffpy.structure.Lattice this is adapting
     name        --  Always "lattice"
     angunits    --  "deg", the units of angle
+    _defer      --  Flag for postponing the lattice updates until flush.
+    _pending    --  Dictionary of lattice parameter values that were not
+                    yet applied to the lattice.
 
     Managed Parameters:
     a, b, c, alpha, beta, gamma --  The lattice parameters (ParameterAdapter).
+                                    They adapt this object rather than
+                                    the lattice to allow deferred updates.
 
     """
 
+    # Default for objects pickled before the deferred updates were added.
+    _defer = False
+
     def __init__(self, lattice):
         """Initialize
 
@@ -185,24 +234,42 @@ class DiffpyLatticeParSet(ParameterSet):
         ParameterSet.__init__(self, "lattice")
         self.angunits = "deg"
         self.lattice = lattice
-        l = lattice
-        self.addParameter(ParameterAdapter("a", l, _latgetter("a"),
-            _latsetter("a")))
-        self.addParameter(ParameterAdapter("b", l, _latgetter("b"),
-            _latsetter("b")))
-        self.addParameter(ParameterAdapter("c", l, _latgetter("c"),
-            _latsetter("c")))
-        self.addParameter(ParameterAdapter("alpha", l, _latgetter("alpha"),
-            _latsetter("alpha")))
-        self.addParameter(ParameterAdapter("beta", l, _latgetter("beta"),
-            _latsetter("beta")))
-        self.addParameter(ParameterAdapter("gamma", l, _latgetter("gamma"),
-            _latsetter("gamma")))
+        self._pending = {}
+        for par in ("a", "b", "c", "alpha", "beta", "gamma"):
+            self.addParameter(ParameterAdapter(par, self, _latgetter(par),
+                _latsetter(par)))
         return
 
     def __repr__(self):
         return repr(self.lattice)
 
+    def deferUpdates(self, defer=True):
+        """Postpone updates of the adapted lattice until flush is called.
+
+        defer   --  When False, apply the pending changes and update the
+                    lattice on every change of its Parameters (default True).
+
+        """
+        self._defer = bool(defer)
+        if not self._defer:
+            self.flush()
+        elif getattr(self, '_pending', None) is None:
+            self._pending = {}
+        return
+
+    def flush(self):
+        """Apply the pending lattice parameter changes to the lattice.
+
+        This rebuilds the lattice metrics only once for any number of
+        changed parameters.
+        """
+        # _pending may be missing in objects pickled by older versions
+        pending = getattr(self, '_pending', None)
+        if pending:
+            self._pending = {}
+            self.lattice.setLatPar(**pending)
+        return
+
 # End class DiffpyLatticeParSet
 
 
@@ -216,6 +283,12 @@ class DiffpyStructureParSet(SrRealParSet):
     atoms   --  The list of DiffpyAtomParSets, provided for convenience.
     stru    --  The diffpy.structure.Structure this is adapting
 
+    Properties:
+    xyzarray    --  Fractional coordinates of all atoms, (N, 3) array.
+    adparray    --  Anisotropic displacement parameters of all atoms as
+                    (N, 6) array with columns U11, U22, U33, U12, U13, U23.
+    cartxyz     --  Cartesian coordinates of all atoms, (N, 3) array.
+
     Managed ParameterSets:
     lattice     --  The managed DiffpyLatticeParSet
     <el><idx>   --  A managed DiffpyAtomParSets. <el> is the atomic element and
@@ -260,6 +333,38 @@ class DiffpyStructureParSet(SrRealParSet):
         """Get the ParameterSet containing the lattice Parameters."""
         return self.lattice
 
+    @property
+    def xyzarray(self):
+        """Fractional coordinates of all atoms as an (N, 3) array.
+
+        This gathers the current atom positions for vectorized calculations.
+        It returns a new array, which is not linked to the structure.
+        """
+        xyz = numpy.array([a.xyz for a in self.stru], dtype=float)
+        return xyz.reshape(-1, 3)
+
+    @property
+    def adparray(self):
+        """Anisotropic displacement parameters as an (N, 6) array.
+
+        The columns are ordered as U11, U22, U33, U12, U13, U23.
+        This returns a new array, which is not linked to the structure.
+        """
+        U = numpy.array([a.U for a in self.stru], dtype=float)
+        U = U.reshape(-1, 3, 3)
+        return U[:, _ADPROWS, _ADPCOLS]
+
+    @property
+    def cartxyz(self):
+        """Cartesian coordinates of all atoms as an (N, 3) array.
+
+        This converts xyzarray with a single matrix product.  Any deferred
+        lattice updates are applied first.  The result is not cached, because
+        atom positions can be changed without notifying this object.
+        """
+        self.lattice.flush()
+        return numpy.dot(self.xyzarray, self.stru.lattice.base)
+
     @classmethod
     def canAdapt(self, stru):
         """Return whether the structure can be adapted by this class."""
@@ -282,10 +387,12 @@ class DiffpyStructureParSet(SrRealParSet):
 
         If this is periodic, then return the structure, otherwise, pass it
         inside of a nosymmetry wrapper. This takes the extra step of wrapping
-        the structure in a nometa wrapper.
+        the structure in a nometa wrapper.  Any deferred lattice updates are
+        applied first.
 
         """
         from diffpy.srreal.structureadapter import nometa
+        self.lattice.flush()
         stru = SrRealParSet._getSrRealStructure(self)
         return nometa(stru)
 
@@ -115,6 +115,96 @@ class TestParameterAdapter(unittest.TestCase):
         return
 
 
+    def test_Bparameters(self):
+        """Check that B-factor parameters are views of U-factors.
+        """
+        stru = Structure([Atom("C", [0, 0.2, 0.5], Uisoequiv=0.005,
+                               anisotropy=True)])
+        dsps = DiffpyStructureParSet("dsps", stru)
+        c0 = dsps.C0
+        class Observer(object):
+            count = 0
+            def update(self, other):
+                self.count += 1
+        uobs = Observer()
+        c0.Uiso.addObserver(uobs.update)
+        c0.Biso.value = 1.0
+        self.assertEqual(1, uobs.count)
+        self.assertAlmostEqual(1.0 / (8 * numpy.pi**2), c0.Uiso.value)
+        self.assertAlmostEqual(1.0, stru[0].Bisoequiv)
+        c0.B12.value = 0.5
+        self.assertAlmostEqual(0.5, stru[0].B12)
+        self.assertAlmostEqual(c0.U12.value, c0.U21.value)
+        self.assertAlmostEqual(0.5, c0.B21.value)
+        # B-factors are available from all lookup paths
+        c0.Biso = 0.5
+        self.assertAlmostEqual(0.5, stru[0].Bisoequiv)
+        self.assertEqual([c0.Biso], list(dsps.iterPars("Biso")))
+        self.assertTrue("B23" in c0.getNames())
+        c0.constrain("U11", "Biso / 79")
+        c0._constraints[c0.U11].update()
+        self.assertAlmostEqual(0.5 / 79, stru[0].U11)
+        return
+
+
+    def test_Ujiparameters(self):
+        """Check the U21, U31, U32 proxies of DiffpyAtomParSet.
+        """
+        stru = Structure([Atom("C", [0, 0.2, 0.5], Uisoequiv=0.005,
+                               anisotropy=True)])
+        dsps = DiffpyStructureParSet("dsps", stru)
+        c0 = dsps.C0
+        names = c0.getNames()
+        self.assertEqual(names.index("U12") + 1, names.index("U21"))
+        self.assertEqual(names.index("U13") + 1, names.index("U31"))
+        self.assertEqual(names.index("U23") + 1, names.index("U32"))
+        c0.U21 = 0.001
+        self.assertEqual(0.001, c0.U12.value)
+        self.assertEqual(0.001, stru[0].U12)
+        self.assertEqual([c0.U21], list(dsps.iterPars("U21")))
+        c0.constrain("U32", "2 * U21")
+        c0._constraints[c0.U32].update()
+        self.assertAlmostEqual(0.002, stru[0].U23)
+        return
+
+
+    def test_deferUpdates(self):
+        """Check deferred updates of DiffpyLatticeParSet.
+        """
+        lat = Lattice(3, 3, 2, 90, 90, 90)
+        stru = Structure([Atom("C", [0, 0.2, 0.5])], lattice=lat)
+        dsps = DiffpyStructureParSet("dsps", stru)
+        dsps.lattice.deferUpdates()
+        dsps.lattice.a.value = 4
+        dsps.lattice.gamma.value = 120
+        self.assertEqual(4, dsps.lattice.a.value)
+        self.assertEqual(120, dsps.lattice.gamma.value)
+        self.assertEqual(3, lat.a)
+        self.assertEqual(90, lat.gamma)
+        dsps.lattice.flush()
+        self.assertEqual(4, lat.a)
+        self.assertEqual(120, lat.gamma)
+        self.assertAlmostEqual(Lattice(4, 3, 2, 90, 90, 120).volume, lat.volume)
+        dsps.lattice.c.value = 5
+        self.assertEqual(2, lat.c)
+        dsps.lattice.deferUpdates(False)
+        self.assertEqual(5, lat.c)
+        dsps.lattice.b.value = 6
+        self.assertEqual(6, lat.b)
+        # objects pickled by older versions have no _defer and _pending
+        del dsps.lattice.__dict__['_defer']
+        del dsps.lattice.__dict__['_pending']
+        dsps2 = pickle.loads(pickle.dumps(dsps))
+        dsps2.lattice.flush()
+        self.assertEqual(6, dsps2.lattice.b.value)
+        dsps2.lattice.deferUpdates()
+        dsps2.lattice.b.value = 7
+        self.assertEqual(7, dsps2.lattice.b.value)
+        dsps2.lattice.flush()
+        self.assertEqual(7, dsps2.stru.lattice.b)
+        return
+
+
     def test___repr__(self):
         """Test representation of DiffpyStructureParSet objects.
         """
@@ -128,6 +218,76 @@ class TestParameterAdapter(unittest.TestCase):
         return
 
 
+    def test_xyzarray(self):
+        """Check DiffpyStructureParSet.xyzarray.
+        """
+        stru = Structure([Atom("C", [0, 0.2, 0.5]), Atom("O", [0.1, 0, 0])])
+        axyz = stru[0].xyz
+        dsps = DiffpyStructureParSet("dsps", stru)
+        # the adapted structure is not modified
+        self.assertTrue(axyz is stru[0].xyz)
+        self.assertTrue(numpy.array_equal(stru.xyz, dsps.xyzarray))
+        dsps.O0.z.value = 0.25
+        self.assertEqual(0.25, stru[1].z)
+        self.assertEqual(0.25, dsps.xyzarray[1, 2])
+        # the array follows replaced atom positions
+        stru.placeInLattice(Lattice(6, 6, 6, 90, 90, 90))
+        self.assertTrue(numpy.array_equal(stru.xyz, dsps.xyzarray))
+        dsps.C0.x.value = 0.4
+        self.assertEqual(0.4, dsps.xyzarray[0, 0])
+        # the array follows parameters of every adapter of the structure
+        dsps2 = DiffpyStructureParSet("dsps2", stru)
+        dsps.C0.y.value = 0.35
+        self.assertEqual(0.35, dsps.xyzarray[0, 1])
+        self.assertEqual(0.35, dsps2.xyzarray[0, 1])
+        stru.addNewAtom("N", [0.5, 0.5, 0.5])
+        self.assertEqual((3, 3), dsps.xyzarray.shape)
+        self.assertEqual((0, 3), DiffpyStructureParSet(
+            "empty", Structure()).xyzarray.shape)
+        return
+
+
+    def test_cartxyz(self):
+        """Check DiffpyStructureParSet.cartxyz.
+        """
+        lat = Lattice(3, 4, 5, 80, 90, 100)
+        stru = Structure([Atom("C", [0, 0.2, 0.5]), Atom("O", [0.1, 0, 0])],
+                         lattice=lat)
+        dsps = DiffpyStructureParSet("dsps", stru)
+        self.assertTrue(numpy.allclose(stru.xyz_cartn, dsps.cartxyz))
+        dsps.lattice.deferUpdates()
+        dsps.lattice.a.value = 3.5
+        dsps.C0.x.value = 0.3
+        xyzc = dsps.cartxyz
+        self.assertEqual(3.5, lat.a)
+        self.assertTrue(numpy.allclose(stru.xyz_cartn, xyzc))
+        # positions are current after the structure changes its lattice
+        stru = Structure([Atom("C", [0.1, 0.2, 0.3])],
+                         lattice=Lattice(3, 3, 3, 90, 90, 90))
+        dsps = DiffpyStructureParSet("dsps", stru)
+        stru.placeInLattice(Lattice(6, 6, 6, 90, 90, 90))
+        self.assertTrue(numpy.allclose([[0.3, 0.6, 0.9]], dsps.cartxyz))
+        self.assertTrue(numpy.allclose(stru.xyz_cartn, dsps.cartxyz))
+        dsps.C0.x.value = 0.5
+        self.assertTrue(numpy.allclose([[3, 0.6, 0.9]], dsps.cartxyz))
+        return
+
+
+    def test_adparray(self):
+        """Check DiffpyStructureParSet.adparray.
+        """
+        U = [[0.01, 0.002, 0.003], [0.002, 0.02, 0.004], [0.003, 0.004, 0.03]]
+        stru = Structure([Atom("C", [0, 0, 0], Uisoequiv=0.005),
+                          Atom("O", [0.1, 0, 0], U=U)])
+        dsps = DiffpyStructureParSet("dsps", stru)
+        adp = dsps.adparray
+        self.assertEqual((2, 6), adp.shape)
+        self.assertTrue(numpy.allclose([0.005, 0.005, 0.005, 0, 0, 0], adp[0]))
+        self.assertTrue(numpy.allclose(
+            [0.01, 0.02, 0.03, 0.002, 0.003, 0.004], adp[1]))
+        return
+
+
     def test_pickling(self):
         """Test pickling of DiffpyStructureParSet.
         """
@@ -137,6 +297,8 @@ class TestParameterAdapter(unittest.TestCase):
         dsps2 = pickle.loads(data)
         self.assertEqual(1, len(dsps2.atoms))
         self.assertEqual(0.2, dsps2.atoms[0].y.value)
+        dsps2.atoms[0].y.value = 0.3
+        self.assertEqual(0.3, dsps2.xyzarray[0, 1])
         return
 
 # End of class TestParameterAdapter
@@ -16,6 +16,8 @@
 """Tests for refinableobj module."""
 
 import unittest
+import sys
+import pickle
 
 from numpy import linspace, array_equal, pi, sin, dot
 
@@ -23,7 +25,7 @@ from diffpy.srfit.fitbase.fitrecipe import FitRecipe
 from diffpy.srfit.fitbase.fitcontribution import FitContribution
 from diffpy.srfit.fitbase.profile import Profile
 from diffpy.srfit.fitbase.parameter import Parameter
-from diffpy.srfit.tests.utils import capturestdout
+from diffpy.srfit.tests.utils import capturestdout, pickleDictState
 
 
 class TestFitRecipe(unittest.TestCase):
@@ -144,6 +146,42 @@ class TestFitRecipe(unittest.TestCase):
         return
 
 
+    def testSetValues(self):
+        """Check FitRecipe.setValues."""
+        recipe = self.recipe
+        con = self.fitcontribution
+        recipe.addVar(con.A, 2)
+        recipe.addVar(con.k, 1)
+        recipe.addVar(con.c, 0)
+        recipe.fix(recipe.k)
+        recipe.setValues([3, 4])
+        self.assertTrue((recipe.getValues() == [3, 4]).all())
+        self.assertEqual(3, con.A.value)
+        self.assertEqual(4, con.c.value)
+        self.assertEqual(1, recipe.k.value)
+        self.assertRaises(ValueError, recipe.setValues, [])
+        self.assertRaises(ValueError, recipe.setValues, [1, 2, 3])
+        self.assertTrue((recipe.getValues() == [3, 4]).all())
+        return
+
+
+    @unittest.skipUnless(sys.version_info >= (3, 8),
+                         "requires Python 3.8 or later")
+    def testPicklingDictState(self):
+        """Check unpickling of a recipe pickled without __slots__."""
+        recipe = self.recipe
+        recipe.addVar(self.fitcontribution.A, 2)
+        recipe.addVar(self.fitcontribution.c, 0.5)
+        res = recipe.residual()
+        recipe2 = pickle.loads(pickleDictState(recipe))
+        self.assertTrue(array_equal(res, recipe2.residual()))
+        self.assertEqual(["A", "c"], recipe2.getNames())
+        recipe2.A = 1
+        self.assertEqual(1, recipe2.cont.A.value)
+        recipe2.c.value = 0
+        self.assertAlmostEqual(0, dot(recipe2.residual(), recipe2.residual()))
+        return
+
     def testResidual(self):
         """Test the residual and everything that can change it."""
 
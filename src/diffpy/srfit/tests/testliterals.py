@@ -191,6 +191,50 @@ class TestConvolutionOperator(unittest.TestCase):
 
 # ----------------------------------------------------------------------------
 
+class TestFFTConvolutionOperator(unittest.TestCase):
+
+    def testValue(self):
+        """Check FFTConvolutionOperator agrees with ConvolutionOperator."""
+
+        exp = numpy.exp
+
+        x = numpy.linspace(0, 10, 1000)
+        g1 = exp(-0.5*((x-4.5)/0.1)**2)
+        a1 = literals.Argument(name = "g1", value = g1)
+        g2 = exp(-0.5*((x-2.5)/0.4)**2)
+        a2 = literals.Argument(name = "g2", value = g2[:700])
+
+        op = literals.FFTConvolutionOperator()
+        op.addLiteral(a1)
+        op.addLiteral(a2)
+        cop = literals.ConvolutionOperator()
+        cop.addLiteral(a1)
+        cop.addLiteral(a2)
+
+        self.assertEqual(len(g1), len(op.value))
+        self.assertTrue(numpy.allclose(cop.value, op.value))
+        return
+
+
+    def testEquationFactory(self):
+        """Check the fftconvolve function in EquationFactory equations."""
+        from diffpy.srfit.equation.builder import EquationFactory
+        x = numpy.linspace(0, 10, 1000)
+        g1 = numpy.exp(-0.5*((x-4.5)/0.1)**2)
+        g2 = numpy.exp(-0.5*((x-2.5)/0.4)**2)
+        factory = EquationFactory()
+        eq = factory.makeEquation("fftconvolve(a, b)")
+        ceq = factory.makeEquation("convolve(a, b)")
+        eq.a.value = g1
+        eq.b.value = g2
+        ceq.a.value = g1
+        ceq.b.value = g2
+        self.assertEqual("fftconvolve", eq.root.symbol)
+        self.assertTrue(numpy.allclose(ceq(), eq()))
+        return
+
+# ----------------------------------------------------------------------------
+
 class TestArrayOperator(unittest.TestCase):
 
     def test_value(self):
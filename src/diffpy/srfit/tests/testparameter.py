@@ -16,9 +16,12 @@
 """Tests for refinableobj module."""
 
 import unittest
+import sys
+import pickle
 
 from diffpy.srfit.fitbase.parameter import Parameter
 from diffpy.srfit.fitbase.parameter import ParameterAdapter, ParameterProxy
+from diffpy.srfit.tests.utils import pickleDictState
 
 
 class TestParameter(unittest.TestCase):
@@ -49,6 +52,37 @@ class TestParameter(unittest.TestCase):
         self.assertAlmostEqual(1.01, l.value)
         return
 
+    def testPickling(self):
+        """Test pickling of Parameter objects with __slots__."""
+        l = Parameter("l", 3.14).boundRange(0, 5)
+        self.assertFalse(hasattr(l, "__dict__"))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            l2 = pickle.loads(pickle.dumps(l, protocol))
+            self.assertEqual("l", l2.name)
+            self.assertEqual(3.14, l2.value)
+            self.assertEqual([0, 5], l2.bounds)
+            self.assertFalse(l2.const)
+        return
+
+    @unittest.skipUnless(sys.version_info >= (3, 8),
+                         "requires Python 3.8 or later")
+    def testPicklingDictState(self):
+        """Test unpickling of Parameter objects pickled without __slots__."""
+        l = Parameter("l").boundRange(0, 5)
+        a = ParameterAdapter("a", l, attr="bounds")
+        p = ParameterProxy("p", l)
+        l2, a2, p2 = pickle.loads(pickleDictState((l, a, p)))
+        self.assertEqual("l", l2.name)
+        self.assertEqual(None, l2.value)
+        self.assertEqual([0, 5], l2.bounds)
+        self.assertFalse(l2.const)
+        self.assertEqual([0, 5], a2.value)
+        self.assertTrue(l2 is p2.par)
+        l2.value = 3
+        self.assertEqual(3, p2.value)
+        self.assertRaises(AttributeError, setattr, l2, "foo", 1)
+        return
+
 class TestParameterProxy(unittest.TestCase):
 
     def testProxy(self):
@@ -71,6 +105,10 @@ class TestParameterProxy(unittest.TestCase):
         self.assertEqual(l.getValue(), la.getValue())
         self.assertEqual(l.value, la.value)
 
+        # The proxy shares the const flag
+        la.setConst()
+        self.assertTrue(l.const)
+        self.assertTrue(la.const)
         return
 
 class TestParameterAdapter(unittest.TestCase):
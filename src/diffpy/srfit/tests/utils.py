@@ -109,4 +109,34 @@ def capturestdout(f, *args, **kwargs):
         sys.stdout = savestdout
     return fp.getvalue()
 
+
+def pickleDictState(obj):
+    """Pickle obj with plain dictionary states of all Observable objects.
+
+    This emulates data pickled by older versions without __slots__.
+    Requires Python 3.8 or later.
+    """
+    import pickle
+    from diffpy.srfit.util.observable import Observable
+
+    class DictStatePickler(pickle.Pickler):
+
+        def reducer_override(self, o):
+            if not isinstance(o, Observable):
+                return NotImplemented
+            rv = list(o.__reduce_ex__(2))
+            state, slotstate = rv[2]
+            d = dict(state or {})
+            d.update(slotstate)
+            # former class defaults were not saved with the instance
+            for n in ('name', '_value'):
+                if n in d and d[n] is None:
+                    del d[n]
+            rv[2] = d
+            return tuple(rv)
+
+    fp = six.BytesIO()
+    DictStatePickler(fp, 2).dump(obj)
+    return fp.getvalue()
+
 # End of file
@@ -14,6 +14,8 @@
 __all__ = ["Observable"]
 
 
+from types import MemberDescriptorType as _MemberDescriptorType
+
 from diffpy.srfit.util.weakrefcallable import weak_ref
 
 
@@ -39,6 +41,8 @@ class Observable(object):
 
     """
 
+    __slots__ = ('_observers', '__weakref__')
+
 
     def notify(self, other=()):
         """
@@ -86,6 +90,51 @@ class Observable(object):
         self._observers = set()
         return
 
+
+    def __getstate__(self):
+        """Return the instance dictionary and slot values for pickling.
+
+        This is required for pickling with the protocols 0 and 1.
+        """
+        tp = type(self)
+        slotstate = {}
+        for cls in tp.__mro__:
+            for n in cls.__dict__.get('__slots__', ()):
+                desc = cls.__dict__[n]
+                # skip slots that are overridden in a derived class
+                if n == '__weakref__' or getattr(tp, n, None) is not desc:
+                    continue
+                try:
+                    slotstate[n] = desc.__get__(self, tp)
+                except AttributeError:
+                    pass
+        state = getattr(self, '__dict__', None) or None
+        return (state, slotstate)
+
+
+    def __setstate__(self, state):
+        """Restore the object from a pickled state.
+
+        state    -- tuple of instance dictionary and slot values as returned
+                    by __getstate__ or a plain dictionary from objects
+                    pickled by older versions, which had no slots.
+        """
+        if isinstance(state, tuple):
+            state, slotstate = state
+        else:
+            slotstate = {}
+        d = getattr(self, '__dict__', None)
+        tp = type(self)
+        for n, v in (state or {}).items():
+            isslot = isinstance(getattr(tp, n, None), _MemberDescriptorType)
+            if d is None or isslot:
+                slotstate[n] = v
+            else:
+                d[n] = v
+        for n, v in slotstate.items():
+            setattr(self, n, v)
+        return
+
 # end of class Observable
 
 # Local helpers --------------------------------------------------------------